@@ -0,0 +1,258 @@
+"""
+Parity tests for the three risk-scoring implementations: the generated
+per-transaction scorer, the Numba kernel and the NumPy batch masks.
+"""
+
+import heapq
+import random
+from dataclasses import FrozenInstanceError
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+import fraud_detection_engine as fde
+
+BACKENDS = ['numpy'] + (['numba'] if fde._HAS_NUMBA else [])
+
+WEIGHTS = {
+    'default': {},
+    'fractional': {'pattern_match': 7.5, 'new_payee': 0.25, 'round_amount': 12.75},
+    'negative': {'pattern_match': -10, 'velocity': -35, 'location_change': 45},
+}
+
+EDGE_CASES = [
+    {},
+    {'hour': 2}, {'hour': 5}, {'hour': 5.5}, {'hour': 1.99}, {'hour': 0},
+    {'transactions_last_hour': 3}, {'transactions_last_hour': 3.5}, {'transactions_last_hour': 4},
+    {'account_age_days': 29.5, 'amount': 2000}, {'account_age_days': 30.0, 'amount': 2000},
+    {'account_age_days': 5, 'amount': 1000}, {'account_age_days': 5, 'amount': 1000.5},
+    {'amount': 500}, {'amount': 700.0}, {'amount': 700.5}, {'amount': 499}, {'amount': 1e6},
+    {'amount': -700}, {'amount': 0, 'avg_transaction_amount': 0},
+    {'amount': float('nan')}, {'amount': float('inf')}, {'amount': float('-inf')},
+    {'amount': 1e20}, {'amount': 2.0 ** 63}, {'amount': 1e300}, {'amount': 1e300 + 2 ** 970},
+    {'amount': 9007199254740993}, {'amount': float('inf'), 'avg_transaction_amount': 500},
+    {'amount': 1500, 'avg_transaction_amount': 500}, {'amount': 1500.01, 'avg_transaction_amount': 500},
+    {'amount': 100, 'avg_transaction_amount': -20},
+    {'location_changed': True, 'new_payee': True, 'pattern_match': True,
+     'transactions_last_hour': 6, 'hour': 3, 'amount': 9000, 'avg_transaction_amount': 250,
+     'account_age_days': 10},
+]
+
+
+def random_transactions(n, seed):
+    """Transactions mixing integer and fractional values across every rule boundary."""
+    rng = random.Random(seed)
+
+    def number(low, high):
+        value = rng.randint(low, high)
+        return value + rng.choice([0, 0, 0.5, 0.01, -0.01])
+
+    return [
+        {
+            'amount': rng.choice([number(0, 15000), rng.randint(1, 150) * 100]),
+            'avg_transaction_amount': number(0, 3000),
+            'hour': number(0, 23),
+            'transactions_last_hour': number(0, 6),
+            'location_changed': rng.random() < 0.3,
+            'new_payee': rng.random() < 0.3,
+            'account_age_days': number(0, 60),
+            'pattern_match': rng.random() < 0.3,
+        }
+        for _ in range(n)
+    ]
+
+
+def make_engine(weights):
+    engine = fde.FraudDetectionEngine()
+    engine.set_weights(**WEIGHTS[weights])
+    return engine
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request, monkeypatch):
+    monkeypatch.setattr(fde, '_HAS_NUMBA', request.param == 'numba')
+    return request.param
+
+
+@pytest.mark.parametrize('weights', sorted(WEIGHTS))
+def test_batch_matches_scalar(backend, weights):
+    engine = make_engine(weights)
+    transactions = EDGE_CASES + random_transactions(2000, seed=len(weights))
+
+    scores, indicator_bits = engine.calculate_risk_scores_batch(transactions)
+
+    for transaction, score, mask in zip(transactions, scores.tolist(), indicator_bits.tolist()):
+        expected_score, expected_indicators = engine.calculate_risk_score(transaction)
+        assert score == expected_score, transaction
+        assert fde._decode_indicators(mask) == expected_indicators, transaction
+
+
+@pytest.mark.parametrize('weights', sorted(WEIGHTS))
+def test_analyze_batch_matches_analyze_transaction(backend, weights):
+    transactions = EDGE_CASES + random_transactions(500, seed=7)
+    serial, batched = make_engine(weights), make_engine(weights)
+
+    expected = [serial.analyze_transaction(t) for t in transactions]
+    results = batched.analyze_batch(transactions)
+
+    for result in expected + results:
+        result['alert'] = result['alert'] and result['alert'].alert_id
+    assert results == expected
+    assert batched.statistics == serial.statistics
+    assert [a.indicators for a in batched.alerts] == [a.indicators for a in serial.alerts]
+
+
+def test_empty_batch(backend):
+    engine = fde.FraudDetectionEngine()
+    scores, indicator_bits = engine.calculate_risk_scores_batch([])
+    assert len(scores) == 0 and len(indicator_bits) == 0
+    assert engine.analyze_batch([]) == []
+    assert engine.statistics['total_transactions'] == 0
+
+
+def test_negative_scores_count_as_normal(backend):
+    engine = make_engine('negative')
+    results = engine.analyze_batch([{'pattern_match': True}, {'transactions_last_hour': 5}])
+
+    assert [r['risk_score'] for r in results] == [-10, -35]
+    assert [r['risk_level'] for r in results] == ['NORMAL', 'NORMAL']
+    assert engine.statistics['total_transactions'] == 2
+    assert engine.statistics['flagged_transactions'] == 0
+
+
+@pytest.mark.parametrize('weight, expected', [
+    (np.float64(7.5), 7.5), (np.int64(20), 20), (Decimal('7.5'), 7.5),
+    (float('inf'), 100), (True, 1),
+])
+def test_non_literal_weights(backend, weight, expected):
+    engine = fde.FraudDetectionEngine()
+    engine.set_weights(velocity=weight)
+    transaction = {'transactions_last_hour': 5}
+
+    assert engine.calculate_risk_score(transaction) == (expected, ['HIGH_VELOCITY'])
+    scores, _ = engine.calculate_risk_scores_batch([transaction])
+    assert scores.tolist() == [expected]
+
+
+def test_non_numeric_weight_fails_when_set():
+    engine = fde.FraudDetectionEngine()
+    with pytest.raises(ValueError):
+        engine.set_weights(velocity='high')
+
+
+def test_alerts_are_immutable():
+    engine = fde.FraudDetectionEngine()
+    alert = engine.generate_alert({'transaction_id': 'TXN1', 'amount': 700}, 85, 'HIGH', ['PATTERN_MATCH'])
+
+    assert engine.alerts == [alert] and engine.alerts is engine.alerts
+    with pytest.raises(FrozenInstanceError):
+        engine.alerts[0].status = 'RESOLVED'
+
+
+def test_tuning_applies_to_every_path(backend):
+    engine = fde.FraudDetectionEngine()
+    engine.set_weights(pattern_match=90)
+    engine.set_thresholds(LOW=5)
+    transaction = {'pattern_match': True}
+
+    assert engine.calculate_risk_score(transaction) == (90, ['PATTERN_MATCH'])
+    assert engine.calculate_risk_scores_batch([transaction])[0].tolist() == [90]
+    assert engine.classify_risk_level(10) == 'LOW'
+    assert engine.classify_risk_levels([10, 4]).tolist() == ['LOW', 'NORMAL']
+
+    # Direct edits to fraud_indicators are picked up by the next set_weights call
+    engine.fraud_indicators['velocity'] = 50
+    engine.set_weights()
+    assert engine.calculate_risk_score({'transactions_last_hour': 5})[0] == 50
+
+    with pytest.raises(KeyError):
+        engine.set_weights(speed=10)
+    with pytest.raises(KeyError):
+        engine.set_thresholds(NORMAL=0)
+
+
+def test_resolve_alert_tracks_pending_review():
+    engine = fde.FraudDetectionEngine()
+    first, second = (engine.generate_alert({'transaction_id': f'TXN{i}'}, 85, 'HIGH', [])
+                     for i in range(2))
+    custom = engine.generate_alert({}, 70, 'MEDIUM', [], alert_id='CASE-1')
+
+    def pending():
+        return engine.generate_report()['alert_summary']['pending_review']
+
+    assert pending() == 3
+    assert engine.resolve_alert(second.alert_id).status == 'RESOLVED'
+    assert engine.alerts[1].status == 'RESOLVED' and second.status == 'PENDING_REVIEW'
+    assert pending() == 2
+
+    engine.resolve_alert(second.alert_id, 'ESCALATED')  # re-resolving does not count twice
+    assert pending() == 2
+    engine.resolve_alert(second.alert_id, 'PENDING_REVIEW')
+    assert pending() == 3
+    engine.resolve_alert('CASE-1', 'FALSE_POSITIVE')
+    assert [a.status for a in engine.alerts] == ['PENDING_REVIEW', 'PENDING_REVIEW', 'FALSE_POSITIVE']
+    assert pending() == 2
+
+    for alert_id in ['ALERT-00004', 'ALERT-xyz', 'FOO-00001', 'CASE-2']:
+        with pytest.raises(KeyError):
+            engine.resolve_alert(alert_id)
+    assert first.status == custom.status == 'PENDING_REVIEW'
+
+
+def test_resolve_alert_accepts_any_number_of_statuses():
+    engine = fde.FraudDetectionEngine()
+    alert = engine.generate_alert({}, 85, 'HIGH', [])
+    for i in range(300):
+        assert engine.resolve_alert(alert.alert_id, f'STATUS-{i}').status == f'STATUS-{i}'
+    assert engine.generate_report()['alert_summary']['pending_review'] == 0
+
+
+def test_top_alerts_match_heapq_past_buffer_growth():
+    engine = fde.FraudDetectionEngine()
+    rng = random.Random(3)
+    scores = [rng.choice([60, 65, 80, 95, 100, 72.5]) for _ in range(3000)]
+    for i, score in enumerate(scores):
+        engine.generate_alert({'transaction_id': f'TXN{i}'}, score, engine.classify_risk_level(score), [])
+
+    assert len(engine.alerts) == 3000 and len(engine._alert_scores) >= 3000
+    assert engine._alert_scores[:3000].tolist() == scores
+    for k in [1, 10, 50, 2999, 3000, 4000]:
+        expected = heapq.nlargest(k, engine.alerts, key=lambda alert: alert.risk_score)
+        assert [engine.alerts[i] for i in engine._top_alert_indices(k).tolist()] == expected
+    assert engine.generate_report()['top_alerts'] == heapq.nlargest(10, engine.alerts, key=lambda a: a.risk_score)
+
+
+def test_worker_pool_matches_serial(monkeypatch):
+    monkeypatch.setattr(fde, '_HAS_NUMBA', False)
+    transactions = EDGE_CASES + random_transactions(3000, seed=11)
+    serial = make_engine('fractional')
+
+    with make_engine('fractional') as engine:
+        for workers in [2, 2, 3]:
+            scores, indicator_bits = engine.calculate_risk_scores_batch(transactions, workers=workers)
+            expected_scores, expected_bits = serial.calculate_risk_scores_batch(transactions)
+            assert scores.tolist() == expected_scores.tolist()
+            assert indicator_bits.tolist() == expected_bits.tolist()
+            assert engine._pool_workers == workers
+            if workers == 2:
+                pool = pool if engine._pool is not None and 'pool' in locals() else engine._pool
+                assert engine._pool is pool  # reused across calls
+        assert engine._pool is not pool  # recreated for a new worker count
+
+        results = engine.analyze_batch(transactions, workers=2)
+        assert [r['risk_score'] for r in results] == [r['risk_score'] for r in serial.analyze_batch(transactions)]
+        pool = engine._pool
+
+    assert engine._pool is None and engine._pool_workers == 0
+    with pytest.raises(RuntimeError):
+        pool.submit(int)  # shut down on leaving the with block
+    engine.close()  # closing again is a no-op
+
+
+@pytest.mark.skipif(not fde._HAS_NUMBA, reason="Numba is not installed")
+def test_workers_ignored_with_numba():
+    engine = fde.FraudDetectionEngine()
+    scores, _ = engine.calculate_risk_scores_batch(EDGE_CASES, workers=4)
+    assert scores.tolist() == [engine.calculate_risk_score(t)[0] for t in EDGE_CASES]
+    assert engine._pool is None